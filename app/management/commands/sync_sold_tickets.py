@@ -0,0 +1,34 @@
+from django.core.management import BaseCommand
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from app.models import Flight, Ticket
+
+
+class Command(BaseCommand):
+    """Django command that recounts sold tickets of flights"""
+
+    help = "Recomputes Flight.sold_tickets from the tickets table"
+
+    def handle(self, *args, **options):
+        booked = Coalesce(
+            Subquery(
+                Ticket.objects.filter(flight=OuterRef("pk"))
+                .order_by()
+                .values("flight")
+                .annotate(count=Count("*"))
+                .values("count"),
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+        stale = Flight.objects.annotate(booked=booked).exclude(
+            sold_tickets=F("booked")
+        )
+        updated = Flight.objects.filter(pk__in=stale.values("pk")).update(
+            sold_tickets=booked
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated sold tickets of {updated} flights")
+        )
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.6 on 2026-10-15 22:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0012_order_ticket"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="flight",
+            name="sold_tickets",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of tickets sold (maintained by Ticket signals)",
+            ),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "UPDATE app_flight SET sold_tickets = ("
+                "SELECT COUNT(*) FROM app_ticket "
+                "WHERE app_ticket.flight_id = app_flight.id)"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,42 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# icontains compiles to UPPER(column::text) LIKE UPPER(%s) on PostgreSQL,
+# so the trigram indexes are built on the same expression.
+TRIGRAM_INDEXES = (
+    ("airplanetype_name_trgm", "app_airplanetype", "name"),
+    ("crew_title_trgm", "app_crew", "title"),
+    ("crew_first_name_trgm", "app_crew", "first_name"),
+    ("crew_last_name_trgm", "app_crew", "last_name"),
+    ("airport_city_trgm", "app_airport", "city"),
+    ("airport_country_trgm", "app_airport", "country"),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+            f"USING gin (UPPER({column}::text) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0014_flight_order_cursor_indexes"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-15 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0016_trigram_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="crew",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -48,6 +48,7 @@ class Crew(models.Model):
     first_name = models.CharField(max_length=64)
     last_name = models.CharField(max_length=64)
     title = models.CharField(choices=TitleCrew.choices, max_length=64)
+    updated_at = models.DateTimeField(auto_now=True)
 
     @property
     def full_name(self):
@@ -132,9 +133,20 @@ class Flight(models.Model):
     crew = models.ManyToManyField(Crew, related_name="flights")
     departure_time = models.DateTimeField()
     arrival_time = models.DateTimeField()
+    sold_tickets = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of tickets sold (maintained by Ticket signals)"
+    )
 
     class Meta:
         ordering = ["-departure_time"]
+        indexes = [
+            models.Index(
+                fields=["-departure_time", "-id"],
+                name="flight_departure_id_idx"
+            ),
+        ]
 
     def __str__(self):
         return (
@@ -168,6 +180,12 @@ class Order(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="order_created_at_id_idx"
+            ),
+        ]
 
 
 class Ticket(models.Model):
@@ -180,6 +198,13 @@ class Ticket(models.Model):
     row = models.IntegerField()
     seat = models.IntegerField()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored flight so a reassignment can be counted.
+        instance._loaded_flight_id = instance.__dict__.get("flight_id")
+        return instance
+
     @staticmethod
     def validate_ticket(row, seat, airplane, error_to_raise):
         for ticket_attr_value, ticket_attr_name, airplane_attr_name in [
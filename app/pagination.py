@@ -0,0 +1,25 @@
+from rest_framework.pagination import CursorPagination
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Cursor pagination keyed on the primary key.
+    """
+
+    ordering = "id"
+
+
+class FlightCursorPagination(CursorPagination):
+    """
+    Cursor pagination for flights, newest departures first.
+    """
+
+    ordering = ("-departure_time", "-id")
+
+
+class OrderCursorPagination(CursorPagination):
+    """
+    Cursor pagination for orders, newest orders first.
+    """
+
+    ordering = ("-created_at", "-id")
@@ -387,11 +387,11 @@ class FlightDetailSerializer(serializers.ModelSerializer):
 
     route = RouteListSerializer(read_only=True)
     airplane = AirplaneListSerializer(read_only=True)
-    crew = CrewListSerializer(many=True, read_only=True)
+    crew = CrewListSerializer(many=True, read_only=True, source="crew_list")
     taken_seats = TicketSeatSerializer(
         many=True, read_only=True, source="tickets"
     )
-    available_seats = serializers.IntegerField(read_only=True)
+    available_seats = serializers.SerializerMethodField()
 
     class Meta:
         model = Flight
@@ -406,6 +406,9 @@ class FlightDetailSerializer(serializers.ModelSerializer):
             "arrival_time",
         )
 
+    def get_available_seats(self, obj: Flight) -> int:
+        return obj.airplane.total_seats - obj.sold_tickets
+
 
 class OrderSerializer(serializers.ModelSerializer):
     """
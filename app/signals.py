@@ -0,0 +1,44 @@
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from app.models import Flight, Ticket
+
+
+def change_sold_tickets(flight_id: int, delta: int) -> None:
+    """
+    Atomically adjusts the sold tickets counter of a flight.
+    """
+    Flight.objects.filter(pk=flight_id).update(
+        sold_tickets=F("sold_tickets") + delta
+    )
+
+
+@receiver(post_save, sender=Ticket)
+def count_saved_ticket(sender, instance: Ticket, created: bool, **kwargs):
+    """
+    Counts a new ticket, or moves an existing one to its new flight.
+    """
+    if kwargs.get("raw"):
+        # Fixtures carry their own sold_tickets values.
+        return
+
+    if created:
+        change_sold_tickets(instance.flight_id, 1)
+    else:
+        previous_flight_id = getattr(
+            instance, "_loaded_flight_id", instance.flight_id
+        )
+        if previous_flight_id != instance.flight_id:
+            change_sold_tickets(previous_flight_id, -1)
+            change_sold_tickets(instance.flight_id, 1)
+
+    instance._loaded_flight_id = instance.flight_id
+
+
+@receiver(post_delete, sender=Ticket)
+def uncount_deleted_ticket(sender, instance: Ticket, **kwargs):
+    """
+    Decrements the sold tickets counter of the flight of a deleted ticket.
+    """
+    change_sold_tickets(instance.flight_id, -1)
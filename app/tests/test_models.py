@@ -1,3 +1,8 @@
+import tempfile
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
 from django.test import TestCase
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError, ErrorDetail
@@ -353,3 +358,101 @@ class TicketTestCase(TestCase):
             context.exception.args[0],
             {"row": "row number must be in available range: " "(1, rows): (1, 5)"},
         )
+
+    def test_sold_tickets_counter(self):
+        ticket = Ticket.objects.create(
+            flight=self.flight, order=self.order, row=1, seat=1
+        )
+        Ticket.objects.create(
+            flight=self.flight, order=self.order, row=1, seat=2
+        )
+        self.flight.refresh_from_db()
+        self.assertEqual(self.flight.sold_tickets, 2)
+
+        ticket.save()
+        self.flight.refresh_from_db()
+        self.assertEqual(self.flight.sold_tickets, 2)
+
+        ticket.delete()
+        self.flight.refresh_from_db()
+        self.assertEqual(self.flight.sold_tickets, 1)
+
+        self.order.delete()
+        self.flight.refresh_from_db()
+        self.assertEqual(self.flight.sold_tickets, 0)
+
+    def test_sold_tickets_counter_on_flight_change(self):
+        other_flight = Flight.objects.create(
+            route=self.route,
+            airplane=self.airplane,
+            departure_time=self.departure_time,
+            arrival_time=self.arrival_time,
+        )
+        Ticket.objects.create(
+            flight=self.flight, order=self.order, row=1, seat=1
+        )
+
+        ticket = Ticket.objects.get(order=self.order)
+        ticket.flight = other_flight
+        ticket.save()
+
+        self.flight.refresh_from_db()
+        other_flight.refresh_from_db()
+        self.assertEqual(self.flight.sold_tickets, 0)
+        self.assertEqual(other_flight.sold_tickets, 1)
+
+    def test_sync_sold_tickets_command(self):
+        Ticket.objects.bulk_create(
+            [
+                Ticket(flight=self.flight, order=self.order, row=1, seat=1),
+                Ticket(flight=self.flight, order=self.order, row=1, seat=2),
+            ]
+        )
+        self.flight.refresh_from_db()
+        self.assertEqual(self.flight.sold_tickets, 0)
+
+        call_command("sync_sold_tickets", stdout=StringIO())
+
+        self.flight.refresh_from_db()
+        self.assertEqual(self.flight.sold_tickets, 2)
+
+
+class SeedDataTestCase(TestCase):
+    fixture_paths = (
+        settings.BASE_DIR / "airports_exemple_for_db_data.json",
+        settings.BASE_DIR / "data_exemple_for_db.json",
+    )
+
+    def assertSoldTicketsMatchTickets(self):
+        for flight in Flight.objects.all():
+            self.assertEqual(flight.sold_tickets, flight.tickets.count())
+
+    def test_load_readme_fixtures(self):
+        call_command("loaddata", *self.fixture_paths, verbosity=0)
+
+        self.assertEqual(User.objects.count(), 5)
+        self.assertEqual(Crew.objects.count(), 8)
+        self.assertEqual(Flight.objects.count(), 5)
+        self.assertSoldTicketsMatchTickets()
+
+    def test_load_readme_fixtures_twice(self):
+        call_command("loaddata", *self.fixture_paths, verbosity=0)
+        call_command("loaddata", *self.fixture_paths, verbosity=0)
+
+        self.assertEqual(Ticket.objects.count(), 6)
+        self.assertSoldTicketsMatchTickets()
+
+    def test_dump_and_load_round_trip(self):
+        call_command("loaddata", *self.fixture_paths, verbosity=0)
+        dump = StringIO()
+        call_command("dumpdata", "app", "user", stdout=dump)
+        Ticket.objects.all().delete()
+        Flight.objects.update(sold_tickets=0)
+
+        with tempfile.NamedTemporaryFile("w", suffix=".json") as fixture:
+            fixture.write(dump.getvalue())
+            fixture.flush()
+            call_command("loaddata", fixture.name, verbosity=0)
+
+        self.assertEqual(Ticket.objects.count(), 6)
+        self.assertSoldTicketsMatchTickets()
@@ -4,7 +4,7 @@ from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.urls import reverse
 from django.utils import timezone
-from rest_framework import status
+from rest_framework import status, viewsets
 from rest_framework.test import APIClient
 
 from app.models import (
@@ -13,7 +13,9 @@ from app.models import (
     Crew,
     Airport,
     Route,
-    Flight
+    Flight,
+    Order,
+    Ticket
 )
 from app.serializers import (
     AirplaneSerializer,
@@ -28,12 +30,18 @@ from app.serializers import (
     FlightListSerializer,
     FlightDetailSerializer,
     FlightSerializer,
+    OrderSerializer,
+    OrderListSerializer,
+    OrderDetailSerializer,
+    OrderListForStaffSerializer,
+    OrderDetailForStaffSerializer,
 )
 from app.views import (
     AirplaneViewSet,
     CrewViewSet,
     AirportViewSet,
-    FlightViewSet
+    FlightViewSet,
+    OrderViewSet
 )
 
 
@@ -94,6 +102,12 @@ class AirplaneViewSetTests(TestCase):
         view.action = "destroy"
         self.assertEqual(view.get_serializer_class(), AirplaneSerializer)
 
+    def test_viewset_overrides_are_not_shadowed(self):
+        for viewset in (AirplaneViewSet, CrewViewSet):
+            self.assertIsNot(
+                viewset.get_queryset, viewsets.ModelViewSet.get_queryset
+            )
+
     def test_retrieve_airplane(self):
         airplane = self.airplanes[0]
         response = self.client.get(
@@ -103,6 +117,22 @@ class AirplaneViewSetTests(TestCase):
         serializer = AirplaneDetailSerializer(airplane)
         self.assertEqual(response.data, serializer.data)
 
+    def test_options_lists_write_actions_for_staff_only(self):
+        response = self.client.options(reverse("app:airplane-list"))
+        self.assertIn("POST", response.data["actions"])
+
+        self.user.is_staff = False
+        self.user.save()
+        response = self.client.options(reverse("app:airplane-list"))
+        self.assertNotIn("actions", response.data)
+
+    def test_retrieve_airplane_without_etag(self):
+        response = self.client.get(
+            reverse("app:airplane-detail", kwargs={"pk": self.airplanes[0].pk})
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("ETag", response.headers)
+
     def test_filter_airplanes_by_type(self):
         response = self.client.get(
             reverse("app:airplane-list") + "?type=Test Type"
@@ -238,6 +268,25 @@ class CrewViewSetTests(TestCase):
         view.action = "destroy"
         self.assertEqual(view.get_serializer_class(), CrewSerializer)
 
+    def test_retrieve_crew_with_malformed_pk(self):
+        response = self.client.get(
+            reverse("app:crew-detail", kwargs={"pk": "abc"})
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_retrieve_crew_not_modified_since(self):
+        url = reverse("app:crew-detail", kwargs={"pk": self.crew.pk})
+        response = self.client.get(url)
+        last_modified = response.headers["Last-Modified"]
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(
+            url + "?title=Nobody", HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_permissions(self):
         self.user.is_staff = False
         self.user.save()
@@ -290,6 +339,35 @@ class CrewViewSetTests(TestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
 
+    def test_filter_crew_by_name_and_title(self):
+        Crew.objects.create(
+            first_name="Jane", last_name="Doe", title="Co-Pilot"
+        )
+        response = self.client.get(
+            reverse("app:crew-list") + "?last_name=doe&title=capt"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [crew["id"] for crew in response.data["results"]],
+            [self.crew.id]
+        )
+
+    def test_filter_crew_by_ids(self):
+        response = self.client.get(
+            reverse("app:crew-list") + f"?crew_id={self.crew.pk},0"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+
+        response = self.client.get(reverse("app:crew-list") + "?crew_id=1,a")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        crew_ids = ",".join(["1"] * 101)
+        response = self.client.get(
+            reverse("app:crew-list") + f"?crew_id={crew_ids}"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_create_crew_instance(self):
         response = self.client.post(
             reverse("app:crew-list"), data=self.crew_data
@@ -451,6 +529,44 @@ class AirportViewSetTests(TestCase):
             response.data["results"][0]["name"], "Anaa Airport"
         )
 
+    def test_blank_filters_are_ignored(self):
+        response = self.client.get(
+            reverse("app:airport-list") + "?city=%20%20&country="
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 2)
+
+        response = self.client.get(
+            reverse("app:airport-list") + "?city=%20Anaa%20"
+        )
+        self.assertEqual(len(response.data["results"]), 1)
+
+    @patch("app.pagination.IdCursorPagination.page_size", 1)
+    def test_list_airports_matches_list_serializer(self):
+        response = self.client.get(reverse("app:airport-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"],
+            [AirportListSerializer(self.airport1).data],
+        )
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            response.data["results"],
+            [AirportListSerializer(self.airport2).data],
+        )
+
+    def test_list_airports_honours_requested_indent(self):
+        url = reverse("app:airport-list")
+        response = self.client.get(url)
+        self.assertNotIn(b"\n", response.content)
+
+        response = self.client.get(
+            url, HTTP_ACCEPT="application/json; indent=4"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(b'\n  "results": [', response.content)
+
     def test_get_airports_by_city(self):
         response = self.client.get(reverse("app:airport-list") + "?city=Anaa")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -587,6 +703,36 @@ class FlightViewSetTestCase(TestCase):
         serializer_class = view.get_serializer_class()
         self.assertEqual(serializer_class, FlightSerializer)
 
+    def test_list_flights_in_single_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("app:flight-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("crew", response.data["results"][0])
+        self.assertNotIn("id", response.data["results"][0]["route"]["source"])
+
+    def test_retrieve_flight_with_crew(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                reverse("app:flight-detail", kwargs={"pk": self.flight.pk})
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [crew["id"] for crew in response.data["crew"]],
+            [self.capitain.id]
+        )
+
+    def test_retrieve_flight_after_booking(self):
+        url = reverse("app:flight-detail", kwargs={"pk": self.flight.pk})
+        self.client.get(url)
+
+        order = Order.objects.create(user=self.user)
+        Ticket.objects.create(flight=self.flight, order=order, row=1, seat=1)
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["available_seats"], 19)
+        self.assertNotIn("ETag", response.headers)
+
     def test_get_permissions_not_authorized(self):
         self.client.logout()
         response = self.client.get(reverse("app:flight-list"))
@@ -720,3 +866,128 @@ class FlightViewSetTestCase(TestCase):
             reverse("app:flight-list"), data=data, format="json"
         )
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+
+class OrderViewSetTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="testuser@example.com",
+            password="testpassword",
+        )
+        self.other_user = get_user_model().objects.create_user(
+            email="otheruser@example.com",
+            password="testpassword",
+        )
+        self.client.force_authenticate(user=self.user)
+
+        source = Airport.objects.create(
+            code="AAA",
+            name="Anaa Airport",
+            country="French Polynesia",
+            city="Anaa",
+            lat=-17.3595,
+            lon=-145.494,
+        )
+        destination = Airport.objects.create(
+            code="AAL",
+            name="Aalborg Airport",
+            city="Norresundby",
+            country="Denmark",
+            lat=57.0952,
+            lon=9.85606,
+        )
+        airplane = Airplane.objects.create(
+            name="Test Airplane",
+            code="ABC123",
+            rows=5,
+            seats_in_row=4,
+            airplane_type=AirplaneType.objects.create(name="Test Type"),
+        )
+        departure_time = timezone.now() + timezone.timedelta(days=1)
+        self.flight = Flight.objects.create(
+            route=Route.objects.create(
+                source=source, destination=destination
+            ),
+            airplane=airplane,
+            departure_time=departure_time,
+            arrival_time=departure_time + timezone.timedelta(hours=2),
+        )
+
+        self.order = Order.objects.create(user=self.user)
+        Ticket.objects.create(
+            flight=self.flight, order=self.order, row=1, seat=1
+        )
+        self.other_order = Order.objects.create(user=self.other_user)
+        Ticket.objects.create(
+            flight=self.flight, order=self.other_order, row=1, seat=2
+        )
+
+    def test_get_serializer_class(self):
+        view = OrderViewSet()
+
+        for is_staff, expected in (
+            (False, (OrderListSerializer, OrderDetailSerializer)),
+            (True, (OrderListForStaffSerializer,
+                    OrderDetailForStaffSerializer)),
+        ):
+            view.is_staff = is_staff
+            view.action = "list"
+            self.assertEqual(view.get_serializer_class(), expected[0])
+            view.action = "retrieve"
+            self.assertEqual(view.get_serializer_class(), expected[1])
+            view.action = "create"
+            self.assertEqual(view.get_serializer_class(), OrderSerializer)
+
+    def test_list_orders_only_own_for_customer(self):
+        response = self.client.get(reverse("app:order-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [order["id"] for order in response.data["results"]],
+            [self.order.id]
+        )
+        self.assertNotIn("user", response.data["results"][0])
+
+    def test_list_orders_for_staff(self):
+        self.user.is_staff = True
+        self.user.save()
+
+        response = self.client.get(reverse("app:order-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [order["id"] for order in response.data["results"]],
+            [self.other_order.id, self.order.id]
+        )
+        self.assertIn("user", response.data["results"][0])
+
+        response = self.client.get(
+            reverse("app:order-list") + f"?user_id={self.other_user.id}"
+        )
+        self.assertEqual(
+            [order["id"] for order in response.data["results"]],
+            [self.other_order.id]
+        )
+
+    def test_orders_are_fetched_with_constant_queries(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("app:order-list"))
+        self.assertEqual(
+            response.data["results"][0]["tickets"][0]["flight"],
+            "Anaa Airport(French Polynesia) -> Aalborg Airport(Denmark)"
+        )
+
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse("app:order-detail", kwargs={"pk": self.order.pk})
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["tickets"][0]["flight"]["airplane"]["name"],
+            "Test Airplane"
+        )
+
+    def test_retrieve_other_users_order_for_customer(self):
+        response = self.client.get(
+            reverse("app:order-detail", kwargs={"pk": self.other_order.pk})
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -1,10 +1,12 @@
-from typing import List
+from typing import Tuple
 
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db.models import (
     QuerySet,
     F,
-    Count
+    Prefetch,
 )
+from django.views.decorators.http import condition
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     extend_schema_view,
@@ -14,14 +16,22 @@ from drf_spectacular.utils import (
     PolymorphicProxySerializer
 )
 from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
 
 from app.models import (
     Airplane,
     Crew,
     Airport,
     Flight,
-    Order
+    Order,
+    Ticket
+)
+from app.pagination import (
+    IdCursorPagination,
+    FlightCursorPagination,
+    OrderCursorPagination,
 )
 from app.serializers import (
     AirplaneSerializer,
@@ -43,26 +53,231 @@ from app.serializers import (
     OrderDetailForStaffSerializer,
 )
 
+WRITE_METHODS = frozenset(("PUT", "PATCH", "DELETE", "POST"))
+ORDER_ADMIN_METHODS = frozenset(("PUT", "PATCH", "DELETE"))
+MAX_FILTER_IDS = 100
+ADMIN_PERMISSIONS = (IsAdminUser(),)
+AUTHENTICATED_PERMISSIONS = (IsAuthenticated(),)
+
+
+def icontains_parameter(name: str, description: str) -> OpenApiParameter:
+    """
+    Describes an optional case-insensitive substring filter.
+    """
+    return OpenApiParameter(
+        name=name,
+        description=f"{description} (case-insensitive substring match)",
+        required=False,
+        type=str,
+    )
+
+
+def admin_crud_schemas(tag: str, name: str) -> dict:
+    """
+    Describes the retrieve and admin-only write actions of a resource.
+    """
+    return {
+        "retrieve": extend_schema(
+            tags=[tag],
+            description=f"Retrieve a single {name} by ID."
+        ),
+        "create": extend_schema(
+            tags=[tag],
+            description=f"Create a new {name}. Requires admin privileges."
+        ),
+        "update": extend_schema(
+            tags=[tag],
+            description=f"Update an existing {name}. "
+                        f"Requires admin privileges."
+        ),
+        "partial_update": extend_schema(
+            tags=[tag],
+            description=f"Partially update an existing {name}. "
+                        f"Requires admin privileges."
+        ),
+        "destroy": extend_schema(
+            tags=[tag],
+            description=f"Delete an existing {name}. "
+                        f"Requires admin privileges."
+        ),
+    }
+
+
+AIRPLANE_LIST_PARAMETERS = [
+    icontains_parameter("type", "Filter airplanes by type"),
+    OpenApiParameter(
+        name="total_seats",
+        description="Filter airplanes with a total number of seats "
+                    "less than or equal to the specified value",
+        required=False,
+        type=int,
+    ),
+]
+CREW_LIST_PARAMETERS = [
+    icontains_parameter("title", "Filter crew members by title"),
+    icontains_parameter("first_name", "Filter crew members by first name"),
+    icontains_parameter("last_name", "Filter crew members by last name"),
+    OpenApiParameter(
+        name="crew_id",
+        description="Filter crew members by IDs "
+                    "(comma-separated list of IDs)",
+        required=False,
+        type=str,
+    ),
+]
+AIRPORT_LIST_PARAMETERS = [
+    icontains_parameter("city", "Filter airports by city"),
+    icontains_parameter("country", "Filter airports by country"),
+]
+FLIGHT_LIST_PARAMETERS = [
+    OpenApiParameter(
+        name="available_seats",
+        description="Filter flights by available seats",
+        required=False,
+        type=int,
+    ),
+]
+ORDER_LIST_PARAMETERS = [
+    OpenApiParameter(
+        name="user_id",
+        description="Filter by user ID (staff only)",
+        required=False,
+        type=int
+    ),
+    OpenApiParameter(
+        name="order_id",
+        description="Filter by order ID",
+        required=False,
+        type=int
+    ),
+    OpenApiParameter(
+        name="flight_id",
+        description="Filter by flight ID",
+        required=False,
+        type=int
+    ),
+]
+
+ORDER_LIST_STAFF_EXAMPLE = OpenApiExample(
+    name="For Staff",
+    description="Retrieve a list of orders for staff.",
+    value=[
+        {
+            "id": 4,
+            "created_at": "2024-07-23T11:37:34.334234+03:00",
+            "tickets": [
+                {
+                    "flight": "Anaa Airport(French Polynesia) "
+                              "-> El Mellah Airport(Algeria)",
+                    "row": 2,
+                    "seat": 2
+                }
+            ],
+            "user": {
+                "id": 1,
+                "email": "test@test.com"
+            }
+        },
+    ],
+    response_only=True
+)
+
+ORDER_LIST_CUSTOMER_EXAMPLE = OpenApiExample(
+    name="For Customers",
+    description="Retrieve a list of orders for customers.",
+    value=[
+        {
+            "id": 4,
+            "created_at": "2024-07-23T11:37:34.334234+03:00",
+            "tickets": [
+                {
+                    "flight": "Anaa Airport(French Polynesia) "
+                              "-> El Mellah Airport(Algeria)",
+                    "row": 2,
+                    "seat": 2
+                }
+            ],
+        }
+    ]
+)
+
+
+def get_query_param(query_params, name: str) -> str | None:
+    """
+    Returns the stripped value of a query parameter,
+    or None if it is missing or blank.
+    """
+    value = query_params.get(name)
+    if value:
+        value = value.strip()
+    return value or None
+
+
+def build_filters(query_params, lookups: dict[str, str]) -> dict:
+    """
+    Maps the non-blank query parameters of the request to ORM lookups.
+    """
+    filters = {}
+    for param, lookup in lookups.items():
+        value = get_query_param(query_params, param)
+        if value:
+            filters[lookup] = value
+    return filters
+
+
+class ConditionalRetrieveMixin:
+    """
+    Answers retrieve requests with 304 Not Modified when the client
+    already holds the current version of the object.
+
+    Only for detail payloads built from the object's own row: changes to
+    embedded related rows do not touch its updated_at.
+    """
+
+    def get_last_modified(self, request, *args, **kwargs):
+        """
+        Returns the last modification time of the requested object,
+        fetched once per request.
+        """
+        if not hasattr(self, "_last_modified"):
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            try:
+                self._last_modified = (
+                    self.filter_queryset(self.get_queryset())
+                    .filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+                    .values_list("updated_at", flat=True)
+                    .first()
+                )
+            except (TypeError, ValueError, DjangoValidationError):
+                # Malformed lookups get their 404 from get_object().
+                self._last_modified = None
+        return self._last_modified
+
+    def get_etag(self, request, *args, **kwargs) -> str | None:
+        """
+        Returns the ETag of the requested object based on its
+        last modification time.
+        """
+        updated_at = self.get_last_modified(request, *args, **kwargs)
+        if updated_at is None:
+            return None
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return f"{kwargs[lookup_url_kwarg]}-{updated_at.timestamp()}"
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieves the object unless the client's copy is still current.
+        """
+        return condition(
+            etag_func=self.get_etag,
+            last_modified_func=self.get_last_modified,
+        )(super().retrieve)(request, *args, **kwargs)
+
 
 @extend_schema_view(
     list=extend_schema(
         tags=["Airplanes"],
-        parameters=[
-            OpenApiParameter(
-                name="type",
-                description="Filter airplanes by type "
-                            "(case-insensitive substring match)",
-                required=False,
-                type=str,
-            ),
-            OpenApiParameter(
-                name="total_seats",
-                description="Filter airplanes with a total number of seats "
-                            "less than or equal to the specified value",
-                required=False,
-                type=int,
-            ),
-        ],
+        parameters=AIRPLANE_LIST_PARAMETERS,
         description="Retrieve a list of airplanes, with optional filtering by "
                     "type and total number of seats.",
         responses={
@@ -71,35 +286,16 @@ from app.serializers import (
             403: OpenApiTypes.OBJECT
         },
     ),
-    retrieve=extend_schema(
-        tags=["Airplanes"],
-        description="Retrieve a single airplane by ID."
-    ),
-    create=extend_schema(
-        tags=["Airplanes"],
-        description="Create a new airplane. Requires admin privileges."
-    ),
-    update=extend_schema(
-        tags=["Airplanes"],
-        description="Update an existing airplane. Requires admin privileges."
-    ),
-    partial_update=extend_schema(
-        tags=["Airplanes"],
-        description="Partially update an existing airplane. "
-                    "Requires admin privileges."
-    ),
-    destroy=extend_schema(
-        tags=["Airplanes"],
-        description="Delete an existing airplane. Requires admin privileges."
-    ),
+    **admin_crud_schemas("Airplanes", "airplane"),
 )
 class AirplaneViewSet(viewsets.ModelViewSet):
     """
     A viewset for performing CRUD operations on airplanes.
     """
 
-    queryset = Airplane.objects.all().select_related()
-    permission_classes = (IsAuthenticated,)
+    queryset = Airplane.objects.select_related("airplane_type")
+    pagination_class = IdCursorPagination
+    filter_lookups = {"type": "airplane_type__name__icontains"}
 
     def get_serializer_class(self):
         """
@@ -111,26 +307,46 @@ class AirplaneViewSet(viewsets.ModelViewSet):
             return AirplaneDetailSerializer
         return AirplaneSerializer
 
+    def list(self, request, *args, **kwargs):
+        """
+        Lists airplanes from plain rows instead of model instances.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            "id", "name", "airplane_type__name"
+        )
+        page = self.paginate_queryset(queryset)
+        airplanes = [
+            {
+                "id": row["id"],
+                "name": row["name"],
+                "airplane_type": row["airplane_type__name"],
+            }
+            for row in (queryset if page is None else page)
+        ]
+
+        if page is not None:
+            return self.get_paginated_response(airplanes)
+        return Response(airplanes)
+
     def get_permissions(self):
         """
         Returns the appropriate permissions based on the request method.
         """
-        if self.request.method in ("PUT", "PATCH", "DELETE", "POST"):
-            return (IsAdminUser(),)
-        return super().get_permissions()
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTHENTICATED_PERMISSIONS
 
     def get_queryset(self) -> QuerySet:
         """
         Returns the appropriate queryset based on the query parameters.
         """
-        airplane_type = self.request.query_params.get("type")
-        total_seats = self.request.query_params.get("total_seats")
-
-        queryset = super(AirplaneViewSet, self).get_queryset()
+        filters = build_filters(self.request.query_params, self.filter_lookups)
+        total_seats = get_query_param(self.request.query_params, "total_seats")
 
-        if airplane_type:
-            queryset = queryset.filter(
-                airplane_type__name__icontains=airplane_type)
+        if filters:
+            queryset = self.queryset.filter(**filters)
+        else:
+            queryset = super(AirplaneViewSet, self).get_queryset()
 
         if total_seats:
             total_seats = int(total_seats)
@@ -144,78 +360,33 @@ class AirplaneViewSet(viewsets.ModelViewSet):
 @extend_schema_view(
     list=extend_schema(
         tags=["Crew"],
-        parameters=[
-            OpenApiParameter(
-                name="title",
-                description="Filter crew members by title "
-                            "(case-insensitive substring match)",
-                required=False,
-                type=str,
-            ),
-            OpenApiParameter(
-                name="first_name",
-                description="Filter crew members by first name "
-                            "(case-insensitive substring match)",
-                required=False,
-                type=str,
-            ),
-            OpenApiParameter(
-                name="last_name",
-                description="Filter crew members by last name "
-                            "(case-insensitive substring match)",
-                required=False,
-                type=str,
-            ),
-            OpenApiParameter(
-                name="crew_id",
-                description="Filter crew members by IDs "
-                            "(comma-separated list of IDs)",
-                required=False,
-                type=str,
-            ),
-        ],
+        parameters=CREW_LIST_PARAMETERS,
         description="Retrieve a list of crew members, with optional filtering "
                     "by title, first name, last name, and crew ID.",
     ),
-    retrieve=extend_schema(
-        tags=["Crew"],
-        description="Retrieve a single crew member by ID."
-    ),
-    create=extend_schema(
-        tags=["Crew"],
-        description="Create a new crew member. Requires admin privileges."
-    ),
-    update=extend_schema(
-        tags=["Crew"],
-        description="Update an existing crew member. "
-                    "Requires admin privileges."
-    ),
-    partial_update=extend_schema(
-        tags=["Crew"],
-        description="Partially update an existing crew member. "
-                    "Requires admin privileges."
-    ),
-    destroy=extend_schema(
-        tags=["Crew"],
-        description="Delete an existing crew member. "
-                    "Requires admin privileges."
-    ),
+    **admin_crud_schemas("Crew", "crew member"),
 )
-class CrewViewSet(viewsets.ModelViewSet):
+class CrewViewSet(ConditionalRetrieveMixin, viewsets.ModelViewSet):
     """
     A viewset for performing CRUD operations on crew members.
     """
 
     queryset = Crew.objects.all()
+    pagination_class = IdCursorPagination
+    filter_lookups = {
+        "title": "title__icontains",
+        "first_name": "first_name__icontains",
+        "last_name": "last_name__icontains",
+    }
 
     def get_permissions(self):
         """
         Returns the appropriate permissions based on the request method.
         """
-        if self.request.method in ("PUT", "PATCH", "DELETE", "POST"):
-            return (IsAdminUser(),)
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
         if self.request.method == "GET":
-            return (IsAuthenticated(),)
+            return AUTHENTICATED_PERMISSIONS
         return super().get_permissions()
 
     def get_serializer_class(self):
@@ -229,77 +400,44 @@ class CrewViewSet(viewsets.ModelViewSet):
         return CrewSerializer
 
     @staticmethod
-    def _params_to_ints(qs: str) -> List[int]:
-        """Converts a list of string IDs to a list of integers"""
-        return [int(str_id) for str_id in qs.split(",")]
+    def _params_to_ints(qs: str) -> Tuple[int, ...]:
+        """Converts a list of string IDs to a tuple of integers"""
+        try:
+            ids = tuple(map(int, qs.split(",")))
+        except ValueError:
+            raise ValidationError(
+                {"crew_id": "Must be a comma-separated list of integers."}
+            )
+        if len(ids) > MAX_FILTER_IDS:
+            raise ValidationError(
+                {"crew_id": f"No more than {MAX_FILTER_IDS} IDs are allowed."}
+            )
+        return ids
 
     def get_queryset(self) -> QuerySet:
         """
         Returns the appropriate queryset based on the query parameters.
         """
-        title = self.request.query_params.get("title")
-        crew_id = self.request.query_params.get("crew_id")
-        first_name = self.request.query_params.get("first_name")
-        last_name = self.request.query_params.get("last_name")
-
-        queryset = super(CrewViewSet, self).get_queryset()
+        filters = build_filters(self.request.query_params, self.filter_lookups)
+        crew_id = get_query_param(self.request.query_params, "crew_id")
 
-        if title:
-            queryset = queryset.filter(title__icontains=title)
-        if first_name:
-            queryset = queryset.filter(first_name__icontains=first_name)
-        if last_name:
-            queryset = queryset.filter(last_name__icontains=last_name)
         if crew_id:
-            crew_ids = self._params_to_ints(crew_id)
-            queryset = queryset.filter(id__in=crew_ids)
+            filters["id__in"] = self._params_to_ints(crew_id)
 
-        return queryset
+        if filters:
+            return self.queryset.filter(**filters)
+
+        return super(CrewViewSet, self).get_queryset()
 
 
 @extend_schema_view(
     list=extend_schema(
         tags=["Airports"],
-        parameters=[
-            OpenApiParameter(
-                name="city",
-                description="Filter airports by city "
-                            "(case-insensitive substring match)",
-                required=False,
-                type=str,
-            ),
-            OpenApiParameter(
-                name="country",
-                description="Filter airports by country "
-                            "(case-insensitive substring match)",
-                required=False,
-                type=str,
-            ),
-        ],
+        parameters=AIRPORT_LIST_PARAMETERS,
         description="Retrieve a list of airports, with optional filtering "
                     "by city and country.",
     ),
-    retrieve=extend_schema(
-        tags=["Airports"],
-        description="Retrieve a single airport by ID."
-    ),
-    create=extend_schema(
-        tags=["Airports"],
-        description="Create a new airport. Requires admin privileges."
-    ),
-    update=extend_schema(
-        tags=["Airports"],
-        description="Update an existing airport. Requires admin privileges."
-    ),
-    partial_update=extend_schema(
-        tags=["Airports"],
-        description="Partially update an existing airport. "
-                    "Requires admin privileges."
-    ),
-    destroy=extend_schema(
-        tags=["Airports"],
-        description="Delete an existing airport. Requires admin privileges."
-    ),
+    **admin_crud_schemas("Airports", "airport"),
 )
 class AirportViewSet(viewsets.ModelViewSet):
     """
@@ -307,14 +445,19 @@ class AirportViewSet(viewsets.ModelViewSet):
     """
 
     queryset = Airport.objects.all()
+    pagination_class = IdCursorPagination
+    filter_lookups = {
+        "city": "city__icontains",
+        "country": "country__icontains",
+    }
 
     def get_permissions(self):
         """
         Returns the appropriate permissions based on the request method.
         """
-        if self.request.method in ("PUT", "PATCH", "DELETE", "POST"):
-            return (IsAdminUser(),)
-        return (IsAuthenticated(),)
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTHENTICATED_PERMISSIONS
 
     def get_serializer_class(self):
         """
@@ -326,58 +469,44 @@ class AirportViewSet(viewsets.ModelViewSet):
             return AirportDetailSerializer
         return AirportSerializer
 
+    def list(self, request, *args, **kwargs):
+        """
+        Lists airports from plain rows instead of model instances.
+        """
+        fields = AirportListSerializer.Meta.fields
+        # The cursor reads each row's id, so it is selected for paging and
+        # left out of the response to match AirportListSerializer.
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            "id", *fields
+        )
+        page = self.paginate_queryset(queryset)
+        rows = queryset if page is None else page
+        data = [{name: row[name] for name in fields} for row in rows]
+
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
     def get_queryset(self):
         """
         Returns the appropriate queryset based on the query parameters.
         """
-        city = self.request.query_params.get("city")
-        country = self.request.query_params.get("country")
-
-        queryset = super(AirportViewSet, self).get_queryset()
+        filters = build_filters(self.request.query_params, self.filter_lookups)
 
-        if city:
-            queryset = queryset.filter(city__icontains=city)
-        if country:
-            queryset = queryset.filter(country__icontains=country)
+        if filters:
+            return self.queryset.filter(**filters)
 
-        return queryset
+        return super(AirportViewSet, self).get_queryset()
 
 
 @extend_schema_view(
     list=extend_schema(
         tags=["Flights"],
-        parameters=[
-            OpenApiParameter(
-                name="available_seats",
-                description="Filter flights by available seats",
-                required=False,
-                type=int,
-            ),
-        ],
+        parameters=FLIGHT_LIST_PARAMETERS,
         description="Retrieve a list of flights, with optional "
                     "filtering by available seats.",
     ),
-    retrieve=extend_schema(
-        tags=["Flights"],
-        description="Retrieve a single flight by ID."
-    ),
-    create=extend_schema(
-        tags=["Flights"],
-        description="Create a new flight. Requires admin privileges."
-    ),
-    update=extend_schema(
-        tags=["Flights"],
-        description="Update an existing flight. Requires admin privileges."
-    ),
-    partial_update=extend_schema(
-        tags=["Flights"],
-        description="Partially update an existing flight. "
-                    "Requires admin privileges."
-    ),
-    destroy=extend_schema(
-        tags=["Flights"],
-        description="Delete an existing flight. Requires admin privileges."
-    ),
+    **admin_crud_schemas("Flights", "flight"),
 )
 class FlightViewSet(viewsets.ModelViewSet):
     """
@@ -389,14 +518,8 @@ class FlightViewSet(viewsets.ModelViewSet):
         .select_related(
             "route__source", "route__destination", "airplane__airplane_type"
         )
-        .prefetch_related("crew")
-        .annotate(
-            available_seats=(
-                F("airplane__rows") * F("airplane__seats_in_row")
-                - Count("tickets")
-            )
-        )
     )
+    pagination_class = FlightCursorPagination
 
     def get_serializer_class(self):
         """
@@ -412,9 +535,49 @@ class FlightViewSet(viewsets.ModelViewSet):
         """
         Returns the appropriate permissions based on the request method.
         """
-        if self.request.method in ("PUT", "PATCH", "DELETE", "POST"):
-            return (IsAdminUser(),)
-        return (IsAuthenticated(),)
+        if self.request.method in WRITE_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTHENTICATED_PERMISSIONS
+
+    def get_queryset(self) -> QuerySet:
+        """
+        Returns the queryset, annotating available seats for the list
+        and prefetching the crew only for actions that render it.
+        """
+        if self.action == "list":
+            queryset = self.queryset.only(
+                "departure_time",
+                "arrival_time",
+                "route__source__name",
+                "route__source__country",
+                "route__source__city",
+                "route__source__lat",
+                "route__source__lon",
+                "route__destination__name",
+                "route__destination__country",
+                "route__destination__city",
+                "route__destination__lat",
+                "route__destination__lon",
+                "airplane__name",
+                "airplane__airplane_type__name",
+            ).annotate(
+                available_seats=(
+                    F("airplane__rows") * F("airplane__seats_in_row")
+                    - F("sold_tickets")
+                )
+            )
+        else:
+            queryset = self.queryset.prefetch_related(
+                Prefetch(
+                    "crew",
+                    queryset=Crew.objects.only(
+                        "id", "first_name", "last_name", "title"
+                    ),
+                    to_attr="crew_list"
+                )
+            )
+
+        return queryset
 
 
 @extend_schema_view(
@@ -431,68 +594,10 @@ class FlightViewSet(viewsets.ModelViewSet):
                 resource_type_field_name="role",
             ),
         },
-        parameters=[
-            OpenApiParameter(
-                name="user_id",
-                description="Filter by user ID (staff only)",
-                required=False,
-                type=int
-            ),
-            OpenApiParameter(
-                name="order_id",
-                description="Filter by order ID",
-                required=False,
-                type=int
-            ),
-            OpenApiParameter(
-                name="flight_id",
-                description="Filter by flight ID",
-                required=False,
-                type=int
-            ),
-        ],
+        parameters=ORDER_LIST_PARAMETERS,
         examples=[
-            OpenApiExample(
-                name="For Staff",
-                description="Retrieve a list of orders for staff.",
-                value=[
-                    {
-                        "id": 4,
-                        "created_at": "2024-07-23T11:37:34.334234+03:00",
-                        "tickets": [
-                            {
-                                "flight": "Anaa Airport(French Polynesia) "
-                                          "-> El Mellah Airport(Algeria)",
-                                "row": 2,
-                                "seat": 2
-                            }
-                        ],
-                        "user": {
-                            "id": 1,
-                            "email": "test@test.com"
-                        }
-                    },
-                ],
-                response_only=True
-            ),
-            OpenApiExample(
-                name="For Customers",
-                description="Retrieve a list of orders for customers.",
-                value=[
-                    {
-                        "id": 4,
-                        "created_at": "2024-07-23T11:37:34.334234+03:00",
-                        "tickets": [
-                            {
-                                "flight": "Anaa Airport(French Polynesia) "
-                                          "-> El Mellah Airport(Algeria)",
-                                "row": 2,
-                                "seat": 2
-                            }
-                        ],
-                    }
-                ]
-            )
+            ORDER_LIST_STAFF_EXAMPLE,
+            ORDER_LIST_CUSTOMER_EXAMPLE,
         ]
     ),
     retrieve=extend_schema(
@@ -532,56 +637,66 @@ class OrderViewSet(viewsets.ModelViewSet):
     """
 
     serializer_class = OrderSerializer
-    queryset = Order.objects.all().prefetch_related(
-        "tickets__flight__route__source",
-        "tickets__flight__route__destination"
+    serializer_classes = {
+        ("list", False): OrderListSerializer,
+        ("retrieve", False): OrderDetailSerializer,
+        ("list", True): OrderListForStaffSerializer,
+        ("retrieve", True): OrderDetailForStaffSerializer,
+    }
+    queryset = Order.objects.prefetch_related(
+        Prefetch(
+            "tickets",
+            queryset=Ticket.objects.select_related(
+                "flight__route__source",
+                "flight__route__destination",
+                "flight__airplane__airplane_type",
+            )
+        )
     )
+    pagination_class = OrderCursorPagination
+    is_staff = False
+
+    def initial(self, request, *args, **kwargs):
+        """
+        Caches the role of the requesting user, used to choose
+        serializers and querysets.
+        """
+        super().initial(request, *args, **kwargs)
+        self.is_staff = request.user.is_staff
 
     def get_permissions(self):
         """
         Returns the appropriate permissions based on the request method.
         """
-        if self.request.method in ("PUT", "PATCH", "DELETE"):
-            return (IsAdminUser(),)
-        return (IsAuthenticated(),)
+        if self.request.method in ORDER_ADMIN_METHODS:
+            return ADMIN_PERMISSIONS
+        return AUTHENTICATED_PERMISSIONS
 
     def get_serializer_class(self):
         """
         Returns the appropriate serializer class based on the action.
         """
-        user = self.request.user
-        if self.action == "list" and user.is_staff:
-            return OrderListForStaffSerializer
-        if self.action == "retrieve" and user.is_staff:
-            return OrderDetailForStaffSerializer
-        if self.action == "list":
-            return OrderListSerializer
-        if self.action == "retrieve":
-            return OrderDetailSerializer
-        return OrderSerializer
+        return self.serializer_classes.get(
+            (self.action, self.is_staff), self.serializer_class
+        )
 
     def get_queryset(self):
         """
         Returns the appropriate queryset based on the query parameters.
         """
-        queryset = super(OrderViewSet, self).get_queryset()
-        user = self.request.user
-
-        user_id = self.request.query_params.get("user_id")
-        order_id = self.request.query_params.get("order_id")
-        flight_id = self.request.query_params.get("flight_id")
-
-        if not user.is_staff:
-            queryset = super(OrderViewSet, self).get_queryset().filter(
-                user=user
-            )
-        if user.is_staff:
-            queryset = queryset.select_related("user")
+        user_id = get_query_param(self.request.query_params, "user_id")
+        order_id = get_query_param(self.request.query_params, "order_id")
+        flight_id = get_query_param(self.request.query_params, "flight_id")
+
+        if self.is_staff:
+            queryset = self.queryset.select_related("user")
+        else:
+            queryset = self.queryset.filter(user=self.request.user)
         if order_id:
             queryset = queryset.filter(id=order_id)
         if flight_id:
             queryset = queryset.filter(tickets__flight__id=flight_id)
-        if user_id and user.is_staff:
-            queryset = queryset.filter(user__id=user_id).select_related("user")
+        if user_id and self.is_staff:
+            queryset = queryset.filter(user__id=user_id)
 
         return queryset
@@ -4,3 +4,18 @@ from django.apps import AppConfig
 class UserConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "user"
+
+    def ready(self):
+        import user.schema  # noqa: F401
+        from django.contrib.auth.hashers import make_password
+        from django.contrib.auth.password_validation import (
+            get_default_password_validators,
+        )
+
+        # Build the validators (CommonPasswordValidator loads its
+        # password list from disk) at startup, not on the first signup.
+        get_default_password_validators()
+
+        # Load the hasher library and run one hash so the first
+        # create_user() or set_password() doesn't pay the cold start.
+        make_password("warmup")
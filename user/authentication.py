@@ -0,0 +1,56 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken
+)
+from rest_framework_simplejwt.settings import api_settings
+
+
+class ProfileJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that loads only the user columns the user
+    endpoints read, leaving out the password hash.
+    """
+
+    user_fields = (
+        "id",
+        "email",
+        "is_active",
+        "is_staff",
+        "first_name",
+        "last_name",
+        "updated_at",
+    )
+
+    def get_user(self, validated_token):
+        """
+        Returns the active user identified by the token.
+        """
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # Revocation compares against the password hash.
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            )
+
+        user = (
+            self.user_model.objects.only(*self.user_fields)
+            .filter(**{api_settings.USER_ID_FIELD: user_id})
+            .first()
+        )
+
+        if user is None:
+            raise AuthenticationFailed(
+                _("User not found"), code="user_not_found"
+            )
+        if not user.is_active:
+            raise AuthenticationFailed(
+                _("User is inactive"), code="user_inactive"
+            )
+
+        return user
@@ -0,0 +1,16 @@
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id hasher using OWASP's minimum recommended configuration
+    (19 MiB of memory, two passes, single lane) instead of Django's
+    heavier defaults.
+
+    The algorithm name is unchanged, so existing hashes still verify and
+    are upgraded to these parameters on the next successful login.
+    """
+
+    time_cost = 2
+    memory_cost = 19456
+    parallelism = 1
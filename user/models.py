@@ -48,6 +48,9 @@ class User(AbstractUser):
     # Add an email field with a unique constraint.
     email = models.EmailField(_("email address"), unique=True)
 
+    # Track profile changes for conditional GET requests.
+    updated_at = models.DateTimeField(auto_now=True)
+
     # Set the USERNAME_FIELD to email.
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
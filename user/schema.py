@@ -0,0 +1,9 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class ProfileJWTScheme(SimpleJWTScheme):
+    """
+    Documents ProfileJWTAuthentication as the regular JWT bearer scheme.
+    """
+
+    target_class = "user.authentication.ProfileJWTAuthentication"
@@ -1,61 +1,205 @@
-from django.contrib.auth import get_user_model, authenticate
+import copy
+import functools
+import re
+
+from django.contrib.auth.hashers import check_password, make_password
 from django.contrib.auth.password_validation import validate_password
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
 from user.models import User
 
+UNABLE_TO_LOG_IN_MESSAGE = _("Unable to log in with provided credentials.")
+ACCOUNT_DISABLED_MESSAGE = _("User account is disabled.")
+MISSING_CREDENTIALS_MESSAGE = _("Must include email and password.")
+INVALID_EMAIL_MESSAGE = _("Enter a valid email address.")
+
+# Login only needs a plausible address: the lookup itself is exact.
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+USER_EXTRA_KWARGS = {
+    "password": {
+        "write_only": True,
+        "min_length": 8,
+        "max_length": 64,
+        "validators": [validate_password],
+        "style": {"input_type": "password", "placeholder": "Password"}
+    },
+    "first_name": {
+        "required": False,
+        "style": {
+            "input_type": "text",
+            "placeholder": "First Name (optional field)"
+        }
+    },
+    "last_name": {
+        "required": False,
+        "style": {
+            "input_type": "text",
+            "placeholder": "Last Name (optional field)"
+        }
+    }
+}
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that introspects the model only once per class and
+    hands every instance copies of the cached fields.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self) -> dict:
+        """
+        Returns copies of the fields built on the first instantiation.
+
+        Declared fields are deep-copied, as ModelSerializer does, since
+        they may hold nested fields or serializers. Fields generated from
+        the model are flat and only need a shallow copy.
+        """
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super(
+                CachedFieldsModelSerializer, self
+            ).get_fields()
+        return {
+            name: (
+                copy.deepcopy(field)
+                if name in self._declared_fields
+                else copy.copy(field)
+            )
+            for name, field in self._fields_cache[cls].items()
+        }
+
 
-class UserSerializer(serializers.ModelSerializer):
+class UserReadSerializer(CachedFieldsModelSerializer):
     """
-    Serializer for User model.
+    Read-only serializer for User model.
     """
 
     class Meta:
         model = User
-        fields = [
-            "id", "email", "password", "is_staff", "first_name", "last_name"
+        fields = ["id", "email", "is_staff", "first_name", "last_name"]
+        read_only_fields = fields
+
+    def to_representation(self, instance: User) -> dict:
+        """
+        Serializes the flat user columns without DRF's per-field
+        attribute lookup and SkipField handling.
+        """
+        try:
+            fields = self._flat_fields
+        except AttributeError:
+            fields = self._flat_fields = tuple(
+                (field.field_name, field.source_attrs, field)
+                for field in self._readable_fields
+            )
+
+        ret = {}
+        for name, source_attrs, field in fields:
+            attribute = instance
+            for attr in source_attrs:
+                attribute = getattr(attribute, attr)
+            ret[name] = (
+                None if attribute is None
+                else field.to_representation(attribute)
+            )
+        return ret
+
+
+class UserListSerializer(serializers.ListSerializer):
+    """
+    Serializer for creating a batch of users with a single INSERT.
+    """
+
+    def validate(self, attrs: list) -> list:
+        """
+        Rejects batches that repeat an email.
+        """
+        emails = [
+            User.objects.normalize_email(item["email"]) for item in attrs
         ]
-        read_only_fields = ["is_staff", ]
-        extra_kwargs = {"password": {
-            "write_only": True,
-            "min_length": 8,
-            "max_length": 64,
-            "validators": [validate_password],
-            "style": {"input_type": "password", "placeholder": "Password"}
-        },
-            "first_name": {
-                "required": False,
-                "style": {
-                    "input_type": "text",
-                    "placeholder": "First Name (optional field)"
-                }
-            },
-            "last_name": {
-                "required": False,
-                "style": {
-                    "input_type": "text",
-                    "placeholder": "Last Name (optional field)"
-                }
-            }
-        }
+        if len(set(emails)) != len(emails):
+            raise serializers.ValidationError(
+                _("Each user in a batch must have a unique email.")
+            )
+        return attrs
+
+    def create(self, validated_data: list) -> list:
+        """
+        Hashes the passwords and inserts all users in bulk.
+        """
+        users = [
+            User(
+                email=User.objects.normalize_email(item["email"]),
+                password=make_password(item["password"]),
+                first_name=item.get("first_name", ""),
+                last_name=item.get("last_name", ""),
+            )
+            for item in validated_data
+        ]
+        return User.objects.bulk_create(users, batch_size=500)
+
+
+class UserWriteSerializer(CachedFieldsModelSerializer):
+    """
+    Serializer for creating and updating User model.
+    """
+
+    class Meta:
+        model = User
+        fields = ["id", "email", "password", "first_name", "last_name"]
+        extra_kwargs = USER_EXTRA_KWARGS
+        list_serializer_class = UserListSerializer
+
+    def to_representation(self, instance: User) -> dict:
+        """
+        Returns the same representation as UserReadSerializer.
+        """
+        return UserReadSerializer(instance, context=self.context).data
 
     def create(self, validated_data: dict) -> User:
         """
         Create and return a new user instance with the validated data.
         """
-        return get_user_model().objects.create_user(**validated_data)
+        return User.objects.create_user(**validated_data)
 
     def update(self, instance: User, validated_data: dict) -> User:
         """
        Update and return an existing user instance with the validated data.
        """
         password = validated_data.pop("password", None)
-        user = super().update(instance, validated_data)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+
+        update_fields = list(validated_data)
         if password:
-            user.set_password(password)
-            user.save()
-        return user
+            instance.set_password(password)
+            update_fields.append("password")
+
+        if update_fields:
+            update_fields.append("updated_at")
+            instance.save(update_fields=update_fields)
+        return instance
+
+
+@functools.cache
+def get_dummy_password_hash() -> str:
+    """
+    Returns a hash to check against when the email is unknown, so that a
+    failed lookup costs as much time as a wrong password.
+    """
+    return make_password("dummy password")
+
+
+def validate_login_email(value: str) -> None:
+    """
+    Rejects values that are not shaped like an email address.
+    """
+    if not EMAIL_PATTERN.fullmatch(value):
+        raise serializers.ValidationError(INVALID_EMAIL_MESSAGE)
 
 
 class AuthTokenSerializer(serializers.Serializer):
@@ -63,7 +207,10 @@ class AuthTokenSerializer(serializers.Serializer):
     Serializer for authenticating a user with email and password.
     """
 
-    email = serializers.EmailField(label=_("Email"))
+    email = serializers.CharField(
+        label=_("Email"),
+        validators=[validate_login_email],
+    )
     password = serializers.CharField(
         style={"input_type": "password"},
         label=_("Password"),
@@ -76,24 +223,29 @@ class AuthTokenSerializer(serializers.Serializer):
         email = attrs.get("email")
         password = attrs.get("password")
 
-        if email and password:
-            user = authenticate(email=email, password=password)
-
-            if user:
-                if not user.is_active:
-                    msg = _("User account is disabled.")
-                    raise serializers.ValidationError(
-                        msg, code="authorization"
-                    )
-            else:
-                msg = _("Unable to log in with provided credentials.")
-                raise serializers.ValidationError(
-                    msg, code="authorization"
-                )
-        else:
-            msg = _("Must include email and password.")
+        if not (email and password):
+            raise serializers.ValidationError(
+                MISSING_CREDENTIALS_MESSAGE, code="authorization"
+            )
+
+        user = (
+            User.objects.only("id", "password", "is_active", "is_staff")
+            .filter(email=email)
+            .first()
+        )
+
+        if user is None:
+            check_password(password, get_dummy_password_hash())
+            raise serializers.ValidationError(
+                UNABLE_TO_LOG_IN_MESSAGE, code="authorization"
+            )
+        if not user.check_password(password):
+            raise serializers.ValidationError(
+                UNABLE_TO_LOG_IN_MESSAGE, code="authorization"
+            )
+        if not user.is_active:
             raise serializers.ValidationError(
-                msg, code="authorization"
+                ACCOUNT_DISABLED_MESSAGE, code="authorization"
             )
 
         attrs["user"] = user
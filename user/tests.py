@@ -1,18 +1,27 @@
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
+from rest_framework import serializers
 from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
 
+from user.serializers import AuthTokenSerializer, UserReadSerializer
 
-class UserViewTestCase(TestCase):
-    def setUp(self):
-        self.client = APIClient()
+FAST_PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 
-        self.user = get_user_model().objects.create_user(
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class UserViewTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             email="test@example.com",
             password="testpassword"
         )
 
+    def setUp(self):
+        self.client = APIClient()
+
     def test_user_view_permissions(self):
         response = self.client.get(reverse("user:users"))
 
@@ -55,15 +64,84 @@ class UserViewTestCase(TestCase):
             }
         )
 
+    def test_user_view_list_is_cursor_paginated(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("user:users"))
 
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("count", response.data)
+        self.assertEqual(
+            [user["email"] for user in response.data["results"]],
+            ["test@example.com"]
+        )
+
+    def test_user_view_bulk_create(self):
+        data = [
+            {"email": "bulk1@example.com", "password": "Bulk-Passw0rd!"},
+            {
+                "email": "bulk2@example.com",
+                "password": "Bulk-Passw0rd!",
+                "first_name": "Bulk",
+            },
+        ]
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(reverse("user:users"), data, "json")
+
+        self.assertEqual(response.status_code, 403)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.post(reverse("user:users"), data, "json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [user["email"] for user in response.data],
+            ["bulk1@example.com", "bulk2@example.com"]
+        )
+        user = get_user_model().objects.get(email="bulk2@example.com")
+        self.assertEqual(user.first_name, "Bulk")
+        self.assertTrue(user.check_password("Bulk-Passw0rd!"))
+
+    def test_user_view_bulk_create_rejects_empty_list(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(reverse("user:users"), [], "json")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_user_view_bulk_create_rejects_duplicate_emails(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+        data = [
+            {"email": "bulk@example.com", "password": "Bulk-Passw0rd!"},
+            {"email": "bulk@example.com", "password": "Bulk-Passw0rd!"},
+        ]
+        response = self.client.post(reverse("user:users"), data, "json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(
+            get_user_model().objects.filter(email="bulk@example.com").exists()
+        )
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class ManageUserViewTestCase(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             email="test@example.com",
             password="testpassword"
         )
 
+    def setUp(self):
+        self.client = APIClient()
+
     def test_manage_user_view_get_object(self):
         response = self.client.get(reverse("user:me"))
         self.assertEqual(response.status_code, 401)
@@ -73,3 +151,126 @@ class ManageUserViewTestCase(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data["email"], "test@example.com")
+
+    def test_manage_user_view_not_modified(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse("user:me"))
+        etag = response.headers["ETag"]
+
+        self.assertEqual(
+            response.headers["Cache-Control"], "private, max-age=30"
+        )
+        self.assertIn("Authorization", response.headers["Vary"])
+
+        response = self.client.get(reverse("user:me"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.client.patch(reverse("user:me"), data={"first_name": "Test"})
+        response = self.client.get(reverse("user:me"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["first_name"], "Test")
+
+    def test_manage_user_view_jwt_loads_profile_columns_only(self):
+        token = AccessToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        with self.assertNumQueries(1) as context:
+            response = self.client.get(reverse("user:me"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["email"], "test@example.com")
+        self.assertNotIn("password", context.captured_queries[0]["sql"])
+
+    def test_manage_user_view_update_password_in_single_query(self):
+        self.client.force_authenticate(user=self.user)
+
+        with self.assertNumQueries(1):
+            response = self.client.patch(
+                reverse("user:me"),
+                data={"first_name": "Test", "password": "N3w-Passw0rd!"}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["is_staff"], False)
+        self.assertNotIn("password", response.data)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, "Test")
+        self.assertTrue(self.user.check_password("N3w-Passw0rd!"))
+
+    def test_manage_user_view_empty_update_skips_save(self):
+        self.client.force_authenticate(user=self.user)
+
+        with self.assertNumQueries(0):
+            response = self.client.patch(reverse("user:me"), data={})
+
+        self.assertEqual(response.status_code, 200)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class AuthTokenSerializerTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            email="test@example.com",
+            password="testpassword"
+        )
+
+    def test_valid_credentials(self):
+        serializer = AuthTokenSerializer(
+            data={"email": "test@example.com", "password": "testpassword"}
+        )
+
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data["user"], self.user)
+
+    def test_invalid_credentials(self):
+        for data in (
+            {"email": "test@example.com", "password": "wrongpassword"},
+            {"email": "missing@example.com", "password": "testpassword"},
+            {"email": "not-an-email", "password": "testpassword"},
+        ):
+            serializer = AuthTokenSerializer(data=data)
+            self.assertFalse(serializer.is_valid())
+
+    def test_inactive_user(self):
+        self.user.is_active = False
+        self.user.save()
+        serializer = AuthTokenSerializer(
+            data={"email": "test@example.com", "password": "testpassword"}
+        )
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            serializer.errors["non_field_errors"],
+            ["User account is disabled."]
+        )
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class UserReadSerializerTestCase(TestCase):
+    def test_to_representation_matches_model_serializer(self):
+        user = get_user_model().objects.create_user(
+            email="test@example.com",
+            password="testpassword",
+            first_name="Test"
+        )
+        serializer = UserReadSerializer()
+
+        self.assertEqual(
+            serializer.to_representation(user),
+            serializers.ModelSerializer.to_representation(serializer, user)
+        )
+
+    def test_declared_nested_fields_are_not_shared(self):
+        class TaggedUserSerializer(UserReadSerializer):
+            tags = serializers.ListField(child=serializers.CharField())
+
+            class Meta(UserReadSerializer.Meta):
+                fields = UserReadSerializer.Meta.fields + ["tags"]
+
+        first = TaggedUserSerializer().fields
+        second = TaggedUserSerializer().fields
+
+        self.assertIsNot(first["tags"].child, second["tags"].child)
+        self.assertIs(first["tags"].child.parent, first["tags"])
+        self.assertIs(second["tags"].child.parent, second["tags"])
@@ -1,7 +1,6 @@
 from django.urls import path
 
-from user.views import ManageUserView
-from user.views import UserView
+from user.views import ManageUserView, UserView
 
 urlpatterns = [
     path("", UserView.as_view(), name="users"),
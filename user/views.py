@@ -1,16 +1,27 @@
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view
 )
-from rest_framework import generics
+from rest_framework import generics, status
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import (
     IsAuthenticated,
     IsAdminUser
 )
+from rest_framework.response import Response
 
+from app.pagination import IdCursorPagination
+from user.authentication import ProfileJWTAuthentication
 from user.models import User
 from user.permissions import IsNotAuthenticatedOrAdmin
-from user.serializers import UserSerializer
+from user.serializers import UserReadSerializer, UserWriteSerializer
+
+ADMIN_PERMISSIONS = (IsAdminUser(),)
+AUTHENTICATED_PERMISSIONS = (IsAuthenticated(),)
+SIGN_UP_PERMISSIONS = (IsNotAuthenticatedOrAdmin(),)
+MAX_USERS_PER_BATCH = 100
 
 
 @extend_schema_view(
@@ -24,23 +35,59 @@ from user.serializers import UserSerializer
         description="Create a new user "
                     "(only for staff users ur unauthenticated user).",
         tags=["User"],
-        request=UserSerializer,
+        request=UserWriteSerializer,
+        responses=UserReadSerializer,
     )
 )
 class UserView(generics.ListCreateAPIView):
     """
     API view for creating a new user and listing all users (only staff).
     """
-    serializer_class = UserSerializer
-    queryset = User.objects.all()
+    serializer_class = UserWriteSerializer
+    queryset = User.objects.only(
+        "id", "email", "is_staff", "first_name", "last_name"
+    ).order_by("id")
+    pagination_class = IdCursorPagination
+    authentication_classes = (ProfileJWTAuthentication,)
 
     def get_permissions(self):
         if self.request.method == "POST":
-            return (IsNotAuthenticatedOrAdmin(),)
+            return SIGN_UP_PERMISSIONS
         elif self.request.method == "GET":
-            return (IsAdminUser(),)
+            return ADMIN_PERMISSIONS
         return super().get_permissions()
 
+    def get_serializer_class(self):
+        """
+        Returns the read serializer for listing users.
+        """
+        if self.request.method == "GET":
+            return UserReadSerializer
+        return UserWriteSerializer
+
+    def create(self, request, *args, **kwargs):
+        """
+        Creates a user, or a batch of users from a list payload
+        (only for staff users).
+        """
+        if not isinstance(request.data, list):
+            return super().create(request, *args, **kwargs)
+
+        if not request.user.is_staff:
+            raise PermissionDenied(
+                "Only staff users can create users in bulk."
+            )
+
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=MAX_USERS_PER_BATCH,
+        )
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
 
 @extend_schema_view(
     get=extend_schema(
@@ -52,24 +99,66 @@ class UserView(generics.ListCreateAPIView):
         summary="Update User Information",
         description="Update the authenticated user's information.",
         tags=["User"],
-        request=UserSerializer,
+        request=UserWriteSerializer,
+        responses=UserReadSerializer,
     ),
     patch=extend_schema(
         summary="Partially Update User Information",
         description="Partially update the authenticated user's information.",
         tags=["User"],
-        request=UserSerializer,
+        request=UserWriteSerializer,
+        responses=UserReadSerializer,
     )
 )
 class ManageUserView(generics.RetrieveUpdateAPIView):
     """
     API view for managing an existing user.
     """
-    serializer_class = UserSerializer
-    permission_classes = (IsAuthenticated,)
+    serializer_class = UserWriteSerializer
+    authentication_classes = (ProfileJWTAuthentication,)
+
+    def get_permissions(self):
+        """
+        Returns the shared authenticated-only permission instances.
+        """
+        return AUTHENTICATED_PERMISSIONS
+
+    def get_serializer_class(self):
+        """
+        Returns the read serializer for retrieving the profile.
+        """
+        if self.request.method == "GET":
+            return UserReadSerializer
+        return UserWriteSerializer
 
     def get_object(self):
         """
         Get the authenticated user.
         """
         return self.request.user
+
+    def get_etag(self, request, *args, **kwargs) -> str:
+        """
+        Returns the ETag of the authenticated user's profile.
+        """
+        return f"{request.user.pk}-{request.user.updated_at.timestamp()}"
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieves the profile unless the client's ETag is still current.
+        """
+        return condition(etag_func=self.get_etag)(super().retrieve)(
+            request, *args, **kwargs
+        )
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """
+        Lets the client briefly cache its own profile.
+        """
+        response = super().finalize_response(
+            request, response, *args, **kwargs
+        )
+        if request.method == "GET":
+            patch_cache_control(response, private=True, max_age=30)
+            patch_vary_headers(response, ("Authorization",))
+        return response